@@ -0,0 +1,8 @@
+import os
+
+from google import genai
+
+# One shared Gemini client for both chatbots: a single HTTP connection
+# pool instead of two, and the key comes from the environment rather
+# than source control.
+client = genai.Client(api_key=os.environ["GEMINI_API_KEY"])
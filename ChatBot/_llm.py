@@ -0,0 +1,224 @@
+"""Shared LLM layer for the Phoenix chatbots.
+
+The exact-match SQLite cache, FAISS semantic cache, batched dispatch and
+streaming generation live here once; ChatBot and MentalHealthChatbot
+each keep only their INSTRUCTIONS plus thin wrappers (the same pattern
+as the shared client in _client.py), so the two copies cannot drift.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from google.genai import types
+
+from ChatBot._client import client
+
+try:
+    import batched
+except ImportError:
+    batched = None
+
+MODEL = "gemini-2.0-flash"
+
+# On-disk response cache: identical prompts skip the Gemini round-trip entirely.
+_CACHE_PATH = os.path.expanduser("~/.phoenix_llm_cache.db")
+_CACHE_TTL = 24 * 60 * 60  # seconds before a cached response is considered stale
+
+_cache_db = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+_cache_db.execute(
+    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+)
+_cache_db.commit()
+
+
+def _cache_key(model, instructions, prompt):
+    return hashlib.sha256((model + instructions + prompt).encode("utf-8")).hexdigest()
+
+
+def _cache_get(key):
+    row = _cache_db.execute(
+        "SELECT response, ts FROM responses WHERE key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    response, ts = row
+    if time.time() - ts > _CACHE_TTL:
+        return None
+    return response
+
+
+def _cache_put(key, response):
+    _cache_db.execute(
+        "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+        (key, response, int(time.time())),
+    )
+    _cache_db.commit()
+
+
+# Semantic cache: paraphrased prompts ("I'm scared" vs "I am frightened") can
+# reuse cached responses via embedding similarity instead of exact key match.
+faiss = None
+SentenceTransformer = None
+_SEMANTIC_OK = None  # probed lazily by _semantic_ok()
+
+
+def _semantic_ok():
+    """Import the semantic-cache stack on first use.
+
+    faiss and sentence-transformers pull in torch — seconds of import
+    time and hundreds of MB of RSS — so the probe is deferred until a
+    prompt actually reaches the semantic layer instead of taxing every
+    process that merely imports the chatbot.
+    """
+    global faiss, SentenceTransformer, _SEMANTIC_OK
+    if _SEMANTIC_OK is None:
+        try:
+            import faiss as _faiss
+            from sentence_transformers import SentenceTransformer as _ST
+        except ImportError:
+            _SEMANTIC_OK = False
+        else:
+            faiss, SentenceTransformer = _faiss, _ST
+            _SEMANTIC_OK = True
+    return _SEMANTIC_OK
+
+
+_SEMANTIC_THRESHOLD = 0.92
+_EMBED_DIM = 384  # all-MiniLM-L6-v2 output dimension
+_INDEX_DIR = os.path.expanduser("~/.phoenix_semantic_cache")
+
+_embedder = None
+_indexes = {}  # instructions -> (faiss index, [[prompt, response], ...])
+
+
+def _get_embedder():
+    global _embedder
+    if _embedder is None:
+        _embedder = SentenceTransformer("all-MiniLM-L6-v2")
+    return _embedder
+
+
+def _index_paths(instructions):
+    # One index per instructions string so AID and ReliefBot answers
+    # never cross-contaminate.
+    tag = hashlib.sha256(instructions.encode("utf-8")).hexdigest()[:16]
+    return (
+        os.path.join(_INDEX_DIR, tag + ".faiss"),
+        os.path.join(_INDEX_DIR, tag + ".json"),
+    )
+
+
+def _get_index(instructions):
+    if instructions not in _indexes:
+        index_path, pairs_path = _index_paths(instructions)
+        if os.path.exists(index_path) and os.path.exists(pairs_path):
+            index = faiss.read_index(index_path)
+            with open(pairs_path, encoding="utf-8") as f:
+                pairs = json.load(f)
+        else:
+            index = faiss.IndexFlatIP(_EMBED_DIM)
+            pairs = []
+        _indexes[instructions] = (index, pairs)
+    return _indexes[instructions]
+
+
+def _embed(prompt):
+    vec = _get_embedder().encode([prompt], normalize_embeddings=True)
+    return vec.astype("float32")
+
+
+def _semantic_get(instructions, vec):
+    index, pairs = _get_index(instructions)
+    if index.ntotal == 0:
+        return None
+    scores, ids = index.search(vec, 1)
+    if scores[0][0] >= _SEMANTIC_THRESHOLD:
+        return pairs[ids[0][0]][1]
+    return None
+
+
+def _semantic_put(instructions, vec, prompt, response):
+    index, pairs = _get_index(instructions)
+    index.add(vec)
+    pairs.append([prompt, response])
+    os.makedirs(_INDEX_DIR, exist_ok=True)
+    index_path, pairs_path = _index_paths(instructions)
+    faiss.write_index(index, index_path)
+    with open(pairs_path, "w", encoding="utf-8") as f:
+        json.dump(pairs, f)
+
+
+def _generate(prompt, instructions):
+    response = client.models.generate_content(
+        model=MODEL,
+        contents=prompt,
+        config=types.GenerateContentConfig(system_instruction=instructions),
+    )
+    return response.text
+
+
+if batched is not None:
+    # Concurrent callers landing within the 50ms window are coalesced into
+    # one dispatch; the batch itself fans out over the shared client so the
+    # per-request fixed cost (TLS, session setup) is amortized.
+    @batched.dynamically(batch_size=8, timeout_ms=50)
+    def _generate_batch(items):
+        with ThreadPoolExecutor(max_workers=min(len(items), 8)) as pool:
+            return list(pool.map(lambda item: _generate(*item), items))
+
+    def _dispatch(prompt, instructions):
+        return _generate_batch([(prompt, instructions)])[0]
+else:
+    def _dispatch(prompt, instructions):
+        return _generate(prompt, instructions)
+
+
+def genResponse(prompt, instructions):
+    key = _cache_key(MODEL, instructions, prompt)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    vec = None
+    if _semantic_ok():
+        vec = _embed(prompt)
+        near = _semantic_get(instructions, vec)
+        if near is not None:
+            return near
+    text = _dispatch(prompt, instructions)
+    _cache_put(key, text)
+    if vec is not None:
+        _semantic_put(instructions, vec, prompt, text)
+    return text
+
+
+def genResponseStream(prompt, instructions):
+    """Yield the response incrementally; cached answers arrive whole."""
+    key = _cache_key(MODEL, instructions, prompt)
+    cached = _cache_get(key)
+    if cached is not None:
+        yield cached
+        return
+    vec = None
+    if _semantic_ok():
+        vec = _embed(prompt)
+        near = _semantic_get(instructions, vec)
+        if near is not None:
+            yield near
+            return
+    parts = []
+    for chunk in client.models.generate_content_stream(
+        model=MODEL,
+        contents=prompt,
+        config=types.GenerateContentConfig(system_instruction=instructions),
+    ):
+        if chunk.text:
+            parts.append(chunk.text)
+            yield chunk.text
+    text = "".join(parts)
+    _cache_put(key, text)
+    if vec is not None:
+        _semantic_put(instructions, vec, prompt, text)
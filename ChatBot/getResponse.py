@@ -0,0 +1,30 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    # Running this file directly (the smoke test below) puts its own
+    # directory first on sys.path; add the repo root so the absolute
+    # ChatBot imports resolve.
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+
+from ChatBot._llm import genResponse, genResponseStream
+
+INSTRUCTIONS = (
+    "You are ReliefBot, the Phoenix disaster relief assistant. "
+    "Help users find shelters, supplies and emergency services near them. "
+    "Keep answers short, calm and practical."
+)
+
+
+def chatbot(prompt):
+    return genResponse(prompt, INSTRUCTIONS)
+
+
+def chatbotStream(prompt):
+    return genResponseStream(prompt, INSTRUCTIONS)
+
+
+if __name__ == "__main__":
+    print(chatbot("Hello, please help me!"))
@@ -0,0 +1,30 @@
+import os
+import sys
+
+if __name__ == "__main__":
+    # Running this file directly (the smoke test below) puts its own
+    # directory first on sys.path; add the repo root so the absolute
+    # ChatBot imports resolve.
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+
+from ChatBot._llm import genResponse, genResponseStream
+
+INSTRUCTIONS = (
+    "You are Phoenix AID, a supportive mental health companion for people "
+    "affected by wildfires and other disasters. Listen first, validate "
+    "feelings, and gently point users to professional help when needed."
+)
+
+
+def chatbot(prompt):
+    return genResponse(prompt, INSTRUCTIONS)
+
+
+def chatbotStream(prompt):
+    return genResponseStream(prompt, INSTRUCTIONS)
+
+
+if __name__ == "__main__":
+    print(chatbot("Hello, please help me!"))
@@ -0,0 +1,768 @@
+import csv
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tkinter as tk
+from tkinter import filedialog, messagebox, ttk
+from tkinter.scrolledtext import ScrolledText
+
+from ChatBot.getResponse import chatbotStream
+
+# pandas, PIL and the ResNet module are imported lazily inside the page
+# methods that need them: they cost seconds of startup time and hundreds
+# of MB of RSS, and a user may never open the pages that use them.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BG = "#1b1b2f"
+FG = "#f5f5f5"
+ACCENT = "#e43f5a"
+
+# Markdown junk stripped from bot replies in one str.translate pass.
+_CLEAN_TBL = str.maketrans({"*": None, "_": None, "#": None})
+
+
+def load_table(csv_path, dtype=None):
+    """Read a data table, preferring a Parquet sidecar over the CSV.
+
+    The sidecar is (re)written whenever the CSV is newer, so appends to
+    the CSV are picked up and later loads take the fast columnar path.
+    """
+    import pandas as pd
+
+    pq_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(
+        csv_path
+    ):
+        try:
+            return pd.read_parquet(pq_path, engine="pyarrow")
+        except Exception:
+            pass
+    # memory_map lets the C parser read straight from the page cache, and
+    # explicit dtypes skip the second type-inference pass.
+    df = pd.read_csv(csv_path, memory_map=True, engine="c", dtype=dtype)
+    try:
+        df.to_parquet(pq_path, engine="pyarrow")
+    except Exception:
+        pass  # no pyarrow: the CSV path still works, just slower
+    return df
+
+
+def _upper_cat(col):
+    """Strip/uppercase a categorical column via its categories array.
+
+    rename_categories raises ValueError when two raw labels normalize to
+    the same string ("BC" vs "bc "); fall back to the per-row pipeline
+    in that case rather than failing the whole load.
+    """
+    cats = col.cat.categories.astype(str).str.strip().str.upper()
+    try:
+        return col.cat.rename_categories(cats)
+    except ValueError:
+        return col.astype(str).str.strip().str.upper()
+
+
+class PhoenixApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Phoenix — Wildfire Response Platform")
+        self.geometry("1100x750")
+        self.configure(bg=BG)
+
+        container = tk.Frame(self, bg=BG)
+        container.pack(side="top", fill="both", expand=True)
+        container.grid_rowconfigure(0, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+
+        self.frames = {}
+        for Page in (
+            HomePage,
+            ChatPage,
+            AlertPage,
+            SendAlertPage,
+            ReliefPage,
+            DamageAssessmentPage,
+        ):
+            frame = Page(container, self)
+            self.frames[Page] = frame
+            frame.grid(row=0, column=0, sticky="nsew")
+
+        self.show_frame(HomePage)
+
+    def show_frame(self, page):
+        self.frames[page].tkraise()
+
+
+class HomePage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+
+        tk.Label(
+            self,
+            text="🔥 Phoenix",
+            font=("Helvetica", 40, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=(60, 5))
+        tk.Label(
+            self,
+            text="Wildfire Response & Relief Platform",
+            font=("Helvetica", 16),
+            bg=BG,
+            fg=FG,
+        ).pack(pady=(0, 40))
+
+        buttons = [
+            ("💬 ReliefBot Chat", ChatPage),
+            ("🚨 Check Alerts", AlertPage),
+            ("📢 Send Alert", SendAlertPage),
+            ("🏥 Find Relief Centers", ReliefPage),
+            ("🛰️ Damage Assessment", DamageAssessmentPage),
+        ]
+        for text, page in buttons:
+            tk.Button(
+                self,
+                text=text,
+                font=("Helvetica", 14),
+                width=28,
+                bg=ACCENT,
+                fg=FG,
+                activebackground="#b92e47",
+                command=lambda p=page: controller.show_frame(p),
+            ).pack(pady=8)
+
+
+class ChatPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+        # Gemini calls run on this executor so the Tk loop never blocks.
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._placeholder_index = None
+        self._stream_started = False
+        # True while a Gemini call is in flight; blocks Enter-key repeats
+        # that the disabled Send button alone doesn't catch.
+        self._pending = False
+
+        tk.Label(
+            self,
+            text="💬 ReliefBot",
+            font=("Helvetica", 22, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=10)
+
+        self.chat_window = ScrolledText(
+            self,
+            wrap="word",
+            font=("Helvetica", 12),
+            bg="#22223a",
+            fg=FG,
+            state="disabled",
+            height=24,
+        )
+        self.chat_window.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        self.chat_window.tag_configure("you", foreground="#6fc3df")
+        self.chat_window.tag_configure("bot", foreground="#f9a826")
+
+        bottom = tk.Frame(self, bg=BG)
+        bottom.pack(fill="x", padx=20, pady=(0, 10))
+        self.entry = tk.Entry(bottom, font=("Helvetica", 12))
+        self.entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        self.entry.bind("<Return>", lambda event: self.send_message())
+        self._send_button = tk.Button(
+            bottom,
+            text="Send",
+            font=("Helvetica", 12),
+            bg=ACCENT,
+            fg=FG,
+            command=self.send_message,
+        )
+        self._send_button.pack(side="right")
+
+        tk.Button(
+            self,
+            text="← Back",
+            command=lambda: controller.show_frame(HomePage),
+            bg="#30305a",
+            fg=FG,
+        ).pack(pady=(0, 15))
+
+    def _insert_chat(self, sender, message):
+        tag = "you" if sender == "You" else "bot"
+        self.chat_window.configure(state="normal")
+        self.chat_window.insert("end", f"{sender}: ", tag)
+        self.chat_window.insert("end", message + "\n\n")
+        self.chat_window.configure(state="disabled")
+        self.chat_window.see("end")
+
+    def send_message(self):
+        if self._pending:
+            return
+        user_input = self.entry.get().strip()
+        if not user_input:
+            return
+        self._pending = True
+        self.entry.delete(0, "end")
+        self._insert_chat("You", user_input)
+
+        # Show a typing placeholder; the streaming call runs on the
+        # executor and each chunk is marshalled back onto the Tk thread,
+        # so the first tokens appear in ~200ms instead of waiting for the
+        # full response.
+        self.chat_window.configure(state="normal")
+        self._placeholder_index = self.chat_window.index("end-1c")
+        self.chat_window.insert("end", "ReliefBot is typing…\n\n", "bot")
+        self.chat_window.configure(state="disabled")
+        self.chat_window.see("end")
+        self._send_button.configure(state="disabled")
+        self._stream_started = False
+
+        self._executor.submit(self._run_stream, user_input)
+
+    def _run_stream(self, user_input):
+        try:
+            for chunk in chatbotStream(user_input):
+                self.after(0, self._append_chunk, chunk)
+        except Exception as exc:
+            self.after(0, self._finish_stream, exc)
+        else:
+            self.after(0, self._finish_stream, None)
+
+    def _append_chunk(self, text):
+        self.chat_window.configure(state="normal")
+        if not self._stream_started:
+            if self._placeholder_index is not None:
+                self.chat_window.delete(self._placeholder_index, "end")
+                self.chat_window.insert("end", "\n")
+                self._placeholder_index = None
+            self.chat_window.insert("end", "ReliefBot: ", "bot")
+            self._stream_started = True
+        # Only strip markdown here: whitespace must survive so words
+        # split across chunk boundaries aren't glued or padded.
+        self.chat_window.insert("end", text.translate(_CLEAN_TBL))
+        self.chat_window.configure(state="disabled")
+        self.chat_window.see("end")
+
+    def _finish_stream(self, exc):
+        self.chat_window.configure(state="normal")
+        if self._placeholder_index is not None:
+            self.chat_window.delete(self._placeholder_index, "end")
+            self.chat_window.insert("end", "\n")
+            self._placeholder_index = None
+        self.chat_window.insert("end", "\n\n")
+        self.chat_window.configure(state="disabled")
+        if exc is not None:
+            self._insert_chat(
+                "ReliefBot", f"Sorry, something went wrong: {exc}"
+            )
+        self.chat_window.see("end")
+        self._send_button.configure(state="normal")
+        self._pending = False
+
+
+class AlertPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+        self.alerts_df = None
+        self._alerts_mtime = None
+        # Duplicate-alert sets so save_alert can dedup with O(1)
+        # membership tests instead of a full parse.
+        self._seen = set()
+        self._seen_area = set()
+        self._seen_mtime = None
+
+        tk.Label(
+            self,
+            text="🚨 Active Alerts",
+            font=("Helvetica", 22, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=10)
+
+        search = tk.Frame(self, bg=BG)
+        search.pack(pady=10)
+        tk.Label(
+            search, text="Your location:", font=("Helvetica", 12), bg=BG, fg=FG
+        ).pack(side="left", padx=(0, 10))
+        self.location_entry = tk.Entry(search, font=("Helvetica", 12), width=30)
+        self.location_entry.pack(side="left", padx=(0, 10))
+        tk.Button(
+            search,
+            text="Check Alerts",
+            bg=ACCENT,
+            fg=FG,
+            command=self.check_alert,
+        ).pack(side="left")
+
+        self.results = ScrolledText(
+            self,
+            wrap="word",
+            font=("Helvetica", 12),
+            bg="#22223a",
+            fg=FG,
+            state="disabled",
+            height=20,
+        )
+        self.results.pack(fill="both", expand=True, padx=20, pady=10)
+
+        tk.Button(
+            self,
+            text="← Back",
+            command=lambda: controller.show_frame(HomePage),
+            bg="#30305a",
+            fg=FG,
+        ).pack(pady=(0, 15))
+
+    def reload_data(self):
+        import pandas as pd
+
+        try:
+            data_path = os.path.join(BASE_DIR, "AlertData", "AlertData.csv")
+            if not os.path.exists(data_path):
+                self.alerts_df = pd.DataFrame()
+                return
+            # Only re-read when the file actually changed.
+            mtime = os.stat(data_path).st_mtime
+            if mtime == self._alerts_mtime and self.alerts_df is not None:
+                return
+            df = load_table(
+                data_path,
+                dtype={
+                    "Location": "string",
+                    "Radius (km)": "string",
+                    "Message": "string",
+                },
+            )
+            # Precompute the casefolded search column once per load so
+            # check_alert doesn't re-lowercase the column on every click.
+            df["_loc_cf"] = df["Location"].astype(str).str.casefold()
+            self.alerts_df = df
+            self._alerts_mtime = mtime
+        except Exception:
+            self.alerts_df = pd.DataFrame()
+
+    def refresh_seen(self):
+        """Rebuild the dedup sets with a streaming csv.DictReader pass.
+
+        save_alert only needs these sets, so there is no reason to pay
+        for a pandas parse (Index/Series allocation, regex chains) on
+        the save path; one pass over the file with tiny constants does
+        it, guarded by the same mtime trick as reload_data.
+        """
+        csv_path = os.path.join(BASE_DIR, "AlertData", "AlertData.csv")
+        if not os.path.exists(csv_path):
+            self._seen, self._seen_area = set(), set()
+            self._seen_mtime = None
+            return
+        mtime = os.stat(csv_path).st_mtime
+        if mtime == self._seen_mtime:
+            return
+        seen, seen_area = set(), set()
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                loc = " ".join(str(row.get("Location", "")).split()).casefold()
+                rad = str(row.get("Radius (km)", "")).strip()
+                msg = " ".join(str(row.get("Message", "")).split()).casefold()
+                seen.add((loc, rad, msg))
+                seen_area.add((loc, rad))
+        self._seen, self._seen_area = seen, seen_area
+        self._seen_mtime = mtime
+
+    def check_alert(self):
+        self.reload_data()
+        query = self.location_entry.get().strip()
+        self.results.configure(state="normal")
+        self.results.delete("1.0", "end")
+        if not query:
+            self.results.insert("end", "Please enter a location.")
+        elif self.alerts_df.empty:
+            self.results.insert("end", "No alert data available.")
+        else:
+            # regex=False: the query is a fixed substring, so use the fast
+            # C find loop and stay safe against user-typed metacharacters.
+            mask = self.alerts_df["_loc_cf"].str.contains(
+                query.casefold(), regex=False, na=False
+            )
+            results = self.alerts_df[mask]
+            if results.empty:
+                self.results.insert(
+                    "end", f"✅ No active alerts found for '{query}'."
+                )
+            else:
+                # itertuples returns plain tuples: ~10x cheaper than the
+                # per-row Series construction iterrows does.
+                rows = results[
+                    ["Date", "Location", "Radius (km)", "Message"]
+                ].itertuples(index=False, name=None)
+                alerts_text = "\n\n".join(
+                    f"🚨 {date} — {loc} ({rad} km):\n{msg}"
+                    for date, loc, rad, msg in rows
+                )
+                self.results.insert("end", alerts_text)
+        self.results.configure(state="disabled")
+
+
+class SendAlertPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+
+        tk.Label(
+            self,
+            text="📢 Send an Alert",
+            font=("Helvetica", 22, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=10)
+
+        form = tk.Frame(self, bg=BG)
+        form.pack(pady=20)
+
+        tk.Label(form, text="Location:", bg=BG, fg=FG, font=("Helvetica", 12)).grid(
+            row=0, column=0, sticky="e", padx=10, pady=8
+        )
+        self.location_entry = tk.Entry(form, font=("Helvetica", 12), width=40)
+        self.location_entry.grid(row=0, column=1, pady=8)
+
+        tk.Label(
+            form, text="Radius (km):", bg=BG, fg=FG, font=("Helvetica", 12)
+        ).grid(row=1, column=0, sticky="e", padx=10, pady=8)
+        self.radius_entry = tk.Entry(form, font=("Helvetica", 12), width=40)
+        self.radius_entry.grid(row=1, column=1, pady=8)
+
+        tk.Label(form, text="Message:", bg=BG, fg=FG, font=("Helvetica", 12)).grid(
+            row=2, column=0, sticky="ne", padx=10, pady=8
+        )
+        self.message_entry = tk.Text(form, font=("Helvetica", 12), width=40, height=5)
+        self.message_entry.grid(row=2, column=1, pady=8)
+
+        tk.Button(
+            self,
+            text="Send Alert",
+            font=("Helvetica", 14),
+            bg=ACCENT,
+            fg=FG,
+            command=self.save_alert,
+        ).pack(pady=10)
+
+        tk.Button(
+            self,
+            text="← Back",
+            command=lambda: controller.show_frame(HomePage),
+            bg="#30305a",
+            fg=FG,
+        ).pack(pady=(0, 15))
+
+    def save_alert(self):
+        location = self.location_entry.get().strip()
+        radius = self.radius_entry.get().strip()
+        message = self.message_entry.get("1.0", "end").strip()
+
+        if not location or not radius or not message:
+            messagebox.showwarning("Missing info", "Please fill in every field.")
+            return
+        try:
+            float(radius)
+        except ValueError:
+            messagebox.showwarning("Bad radius", "Radius must be a number.")
+            return
+
+        csv_path = os.path.join(BASE_DIR, "AlertData", "AlertData.csv")
+
+        # Appending one row doesn't need the full frame: check against the
+        # dedup sets AlertPage keeps in sync with the file, then stream a
+        # single CSV row in append mode.
+        alert_page = self.controller.frames[AlertPage]
+        alert_page.refresh_seen()
+
+        loc_norm = " ".join(location.split()).casefold()
+        msg_norm = " ".join(message.split()).casefold()
+
+        if (loc_norm, radius, msg_norm) in alert_page._seen:
+            messagebox.showinfo(
+                "Duplicate", "This exact alert has already been sent."
+            )
+            return
+        if (loc_norm, radius) in alert_page._seen_area and not messagebox.askyesno(
+            "Similar alert",
+            "An alert already exists for this area. Send anyway?",
+        ):
+            return
+
+        write_header = (
+            not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+        )
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(["Date", "Location", "Radius (km)", "Message"])
+            writer.writerow(
+                [
+                    time.strftime("%Y-%m-%d"),
+                    location,
+                    radius,
+                    " ".join(message.split()),
+                ]
+            )
+        alert_page._seen.add((loc_norm, radius, msg_norm))
+        alert_page._seen_area.add((loc_norm, radius))
+
+        messagebox.showinfo("Sent", "✅ Alert sent successfully!")
+        self.location_entry.delete(0, "end")
+        self.radius_entry.delete(0, "end")
+        self.message_entry.delete("1.0", "end")
+
+
+class ReliefPage(tk.Frame):
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+        self.data = None
+        self._centers_mtime = None
+        self._by_prov = {}
+        self._by_prov_full = {}
+
+        tk.Label(
+            self,
+            text="🏥 Relief Centers",
+            font=("Helvetica", 22, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=10)
+
+        search = tk.Frame(self, bg=BG)
+        search.pack(pady=10)
+        tk.Label(
+            search,
+            text="City or province:",
+            font=("Helvetica", 12),
+            bg=BG,
+            fg=FG,
+        ).pack(side="left", padx=(0, 10))
+        self.search_entry = tk.Entry(search, font=("Helvetica", 12), width=30)
+        self.search_entry.pack(side="left", padx=(0, 10))
+        tk.Button(
+            search,
+            text="Find Relief",
+            bg=ACCENT,
+            fg=FG,
+            command=self.find_relief,
+        ).pack(side="left")
+
+        columns = ("Name", "Type", "City", "Distance", "Contact")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=14)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=180, anchor="w")
+        self.tree.pack(fill="both", expand=True, padx=20, pady=10)
+
+        tk.Button(
+            self,
+            text="← Back",
+            command=lambda: controller.show_frame(HomePage),
+            bg="#30305a",
+            fg=FG,
+        ).pack(pady=(0, 15))
+
+    def load_data(self):
+        import pandas as pd
+
+        try:
+            data_path = os.path.join(BASE_DIR, "Relief", "ReliefCenters.csv")
+            # Only re-read when the file actually changed.
+            mtime = os.stat(data_path).st_mtime
+            if mtime == self._centers_mtime and self.data is not None:
+                return
+            df = load_table(
+                data_path,
+                dtype={
+                    "Name": "string",
+                    "Type": "category",
+                    "City": "string",
+                    "Province": "category",
+                    "Province_Full": "category",
+                    "Contact": "string",
+                },
+            )
+            # Low-cardinality columns as categoricals: rows become small
+            # integer codes and comparisons stop walking Python strings.
+            # (astype is a no-op on the CSV path; it covers older Parquet
+            # sidecars written before this change.)
+            for col in ("Province", "Province_Full", "Type"):
+                df[col] = df[col].astype("category")
+            # Normalized comparison columns, computed once per load
+            # instead of on every search. For the categoricals the
+            # normalization touches only the ~13 category labels.
+            df["_city_u"] = df["City"].astype(str).str.strip().str.upper()
+            df["_prov_u"] = _upper_cat(df["Province"])
+            df["_prov_full_u"] = _upper_cat(df["Province_Full"])
+            # O(1) exact-province lookup tables: code/full name -> row
+            # positions, so the common "BC"/"ONTARIO" query never scans.
+            self._by_prov = df.groupby("_prov_u").indices
+            self._by_prov_full = df.groupby("_prov_full_u").indices
+            self.data = df
+            self._centers_mtime = mtime
+        except Exception:
+            self.data = pd.DataFrame()
+
+    def find_relief(self):
+        query = self.search_entry.get().strip()
+        if not query:
+            messagebox.showwarning("Missing info", "Please enter a city or province.")
+            return
+        # Always go through load_data: the mtime guard makes unchanged
+        # repeats O(1), and edits to ReliefCenters.csv are picked up.
+        self.load_data()
+        results = self.filter_centers(query)
+        self.display_results(results)
+
+    def filter_centers(self, query):
+        if self.data.empty:
+            return self.data
+        df = self.data
+        q = query.strip().upper()
+
+        city_u = df["_city_u"]
+        prov_u = df["_prov_u"]
+        prov_full_u = df["_prov_full_u"]
+
+        # Exact province code or full name first, then progressively
+        # looser substring matches.
+        idx = self._by_prov.get(q)
+        if idx is None:
+            idx = self._by_prov_full.get(q)
+        if idx is not None:
+            return df.iloc[idx].sort_values(by="Distance (km)")
+
+        city_hits = df[city_u.str.contains(q, regex=False, na=False)]
+        if not city_hits.empty:
+            return city_hits.sort_values(by="Distance (km)")
+
+        full_hits = df[prov_full_u.str.contains(q, regex=False, na=False)]
+        if not full_hits.empty:
+            return full_hits.sort_values(by="Distance (km)")
+
+        code_hits = df[prov_u.str.contains(q, regex=False, na=False)]
+        return code_hits.sort_values(by="Distance (km)")
+
+    def display_results(self, results):
+        self.tree.delete(*self.tree.get_children())
+        if results.empty:
+            messagebox.showinfo("No results", "No relief centers found.")
+            return
+        for _, row in results.iterrows():
+            self.tree.insert(
+                "",
+                "end",
+                values=(
+                    row["Name"],
+                    row["Type"],
+                    row["City"],
+                    f"{row['Distance (km)']} km",
+                    row["Contact"],
+                ),
+            )
+
+
+class DamageAssessmentPage(tk.Frame):
+    # Preview PhotoImages keyed by path: re-selecting the same file skips
+    # the decode entirely (and keeps Tk references alive).
+    _photo_cache = {}
+
+    def __init__(self, parent, controller):
+        super().__init__(parent, bg=BG)
+        self.controller = controller
+        self.image = None
+        self.image_path = None
+        self.photo = None
+
+        tk.Label(
+            self,
+            text="🛰️ Damage Assessment",
+            font=("Helvetica", 22, "bold"),
+            bg=BG,
+            fg=ACCENT,
+        ).pack(pady=10)
+
+        self.image_label = tk.Label(
+            self, text="No image uploaded", bg="#22223a", fg=FG, width=90, height=25
+        )
+        self.image_label.pack(padx=20, pady=10)
+
+        self.result_label = tk.Label(
+            self, text="", font=("Helvetica", 14, "bold"), bg=BG, fg=FG
+        )
+        self.result_label.pack(pady=5)
+
+        row = tk.Frame(self, bg=BG)
+        row.pack(pady=10)
+        tk.Button(
+            row,
+            text="Upload Satellite Image",
+            bg=ACCENT,
+            fg=FG,
+            command=self.upload_image,
+        ).pack(side="left", padx=10)
+        tk.Button(
+            row,
+            text="Analyze",
+            bg=ACCENT,
+            fg=FG,
+            command=self.analyze_image,
+        ).pack(side="left", padx=10)
+
+        tk.Button(
+            self,
+            text="← Back",
+            command=lambda: controller.show_frame(HomePage),
+            bg="#30305a",
+            fg=FG,
+        ).pack(pady=(0, 15))
+
+    def upload_image(self):
+        file_path = filedialog.askopenfilename(
+            filetypes=[("Images", "*.png *.jpg *.jpeg *.bmp")]
+        )
+        if not file_path:
+            return
+        from PIL import Image, ImageTk
+
+        self.image_path = file_path
+        photo = self._photo_cache.get(file_path)
+        if photo is None:
+            im = Image.open(file_path)
+            # draft() lets libjpeg do the bulk of the downscale during
+            # decode, so we never hold the full-resolution pixels.
+            im.draft("RGB", (1000, 800))
+            im.thumbnail((1000, 800), Image.LANCZOS)
+            photo = ImageTk.PhotoImage(im)
+            self._photo_cache[file_path] = photo
+            self.image = im
+        self.photo = photo
+        self.image_label.configure(image=self.photo, text="", width=0, height=0)
+        self.result_label.configure(text="")
+
+    def analyze_image(self):
+        if not self.image_path:
+            messagebox.showwarning("No image", "Please upload an image first.")
+            return
+        from SatelliteAI.PreTrained.ResNet_Satellite import predict_fire_risk
+
+        prediction = predict_fire_risk(self.image_path)
+        if prediction == 0:
+            self.result_label.configure(
+                text="🔥 Fire damage detected — HIGH risk area", fg=ACCENT
+            )
+        else:
+            self.result_label.configure(
+                text="✅ No fire damage detected — low risk", fg="#7ed957"
+            )
+
+
+if __name__ == "__main__":
+    app = PhoenixApp()
+    app.mainloop()
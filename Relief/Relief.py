@@ -0,0 +1,308 @@
+import os
+import re
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox, ttk
+
+import numpy as np
+import pandas as pd
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+except ImportError:
+    process = None
+
+DATA_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "ReliefCenters.csv"
+)
+
+REQUIRED_COLUMNS = [
+    "Name",
+    "Type",
+    "City",
+    "Province",
+    "Province_Full",
+    "Distance (km)",
+    "Contact",
+]
+
+# The Treeview only ever shows this many rows, so there is no point in
+# fully sorting large match sets.
+TOP_K = 12
+
+
+def _upper_cat(col):
+    """Uppercase/strip a categorical column by rewriting its categories.
+
+    Touches only the unique labels instead of every row; falls back to
+    the per-row pipeline if normalization would merge two raw spellings.
+    """
+    cats = col.cat.categories.astype(str).str.strip().str.upper()
+    try:
+        return col.cat.rename_categories(cats)
+    except ValueError:
+        return col.astype(str).str.strip().str.upper()
+
+
+class ReliefPage(tk.Frame):
+    """Standalone relief-center finder used by the Relief module."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.data = None
+        self._dist = None
+        self._bigram_index = {}
+        self._exact_prov = {}
+        self._choices = []
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_after = None
+
+        tk.Label(
+            self, text="🏥 Phoenix Relief Finder", font=("Helvetica", 20, "bold")
+        ).pack(pady=10)
+
+        search = tk.Frame(self)
+        search.pack(pady=10)
+        tk.Label(search, text="City or province:", font=("Helvetica", 12)).pack(
+            side="left", padx=(0, 10)
+        )
+        self.search_entry = tk.Entry(search, font=("Helvetica", 12), width=30)
+        self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind("<Return>", lambda event: self.find_relief())
+        tk.Button(search, text="Find Relief", command=self.find_relief).pack(
+            side="left", padx=(0, 10)
+        )
+        tk.Button(search, text="Reload Data", command=self.reload_data).pack(
+            side="left"
+        )
+
+        columns = ("Name", "Type", "City", "Distance", "Contact")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=14)
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=170, anchor="w")
+        self.tree.pack(fill="both", expand=True, padx=20, pady=10)
+
+        self.load_data()
+
+    def load_data(self):
+        try:
+            # Transparent Parquet sidecar: parse the CSV once, then every
+            # later startup/reload reads the columnar file in a fraction
+            # of the time. The CSV stays the source of truth — touching
+            # it invalidates the sidecar via the mtime comparison.
+            pq_path = DATA_PATH.replace(".csv", ".parquet")
+            df = None
+            if os.path.exists(pq_path) and os.path.getmtime(
+                pq_path
+            ) >= os.path.getmtime(DATA_PATH):
+                try:
+                    df = pd.read_parquet(pq_path)
+                except Exception:
+                    df = None
+            if df is None:
+                # Arrow-backed strings are a contiguous buffer + offsets
+                # instead of one PyObject per cell: far less RAM and the
+                # .str ops dispatch to Arrow compute kernels.
+                try:
+                    df = pd.read_csv(
+                        DATA_PATH, engine="pyarrow", dtype_backend="pyarrow"
+                    )
+                except (ImportError, ValueError):
+                    df = pd.read_csv(DATA_PATH)
+                try:
+                    df.to_parquet(pq_path, compression="zstd")
+                except Exception:
+                    pass  # no pyarrow: keep using the CSV
+        except Exception as exc:
+            messagebox.showerror("Data error", f"Could not load relief data: {exc}")
+            self.data = pd.DataFrame(columns=REQUIRED_COLUMNS)
+            return
+        for col in REQUIRED_COLUMNS:
+            if col not in df.columns:
+                messagebox.showerror("Data error", f"Missing column: {col}")
+                self.data = pd.DataFrame(columns=REQUIRED_COLUMNS)
+                return
+        # Clean once at load: stray whitespace never reaches the search
+        # path, and a numeric distance column means the sort never falls
+        # back to object-dtype comparisons.
+        for col in ("Province", "Province_Full", "City", "Name", "Type", "Contact"):
+            df[col] = df[col].astype("string").str.strip()
+        df["Distance (km)"] = pd.to_numeric(
+            df["Distance (km)"], errors="coerce"
+        ).astype("float32")
+        # Repeated labels become int codes over one small categories
+        # array: less RAM, and normalization only walks the uniques.
+        for col in ("Province", "Province_Full", "City", "Type"):
+            df[col] = df[col].astype("category")
+        # Normalized comparison columns are computed once per load so
+        # every search skips the O(N) strip/upper pipeline.
+        df["_city_u"] = _upper_cat(df["City"])
+        df["_prov_u"] = _upper_cat(df["Province"])
+        df["_prov_full_u"] = _upper_cat(df["Province_Full"])
+        # Inverted bigram index over the searchable strings: query-time
+        # candidate lookup costs O(bigrams(q)) posting-list intersections
+        # instead of an O(N) substring scan per query. It only backs the
+        # substring fallback, so when rapidfuzz is available (and the
+        # fuzzy branch always returns first) the build is skipped.
+        build_bigrams = process is None
+        bigrams = {}
+        exact_prov = {}
+        for i, (city, prov, full) in enumerate(
+            zip(df["_city_u"], df["_prov_u"], df["_prov_full_u"])
+        ):
+            if build_bigrams:
+                for s in (str(city), str(full)):
+                    for j in range(len(s) - 1):
+                        bigrams.setdefault(s[j : j + 2], set()).add(i)
+            exact_prov.setdefault(str(prov), []).append(i)
+            exact_prov.setdefault(str(full), []).append(i)
+        self._bigram_index = bigrams
+        self._exact_prov = exact_prov
+        # Haystack strings for RapidFuzz, one per row.
+        self._choices = (
+            df["City"].astype(str) + "|" + df["Province_Full"].astype(str)
+        ).tolist()
+        self._dist = df["Distance (km)"].to_numpy(dtype=np.float32)
+        self.data = df
+
+    def reload_data(self):
+        self.load_data()
+
+    def find_relief(self):
+        # Debounce rapid clicks/Enter mashes into one search, then run
+        # the pandas pass off the Tk thread so the UI never freezes.
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(100, self._do_search)
+
+    def _do_search(self):
+        self._pending_after = None
+        query = self.search_entry.get().strip()
+        if not query:
+            messagebox.showwarning("Missing info", "Please enter a city or province.")
+            return
+        future = self._executor.submit(self.filter_centers, query)
+        future.add_done_callback(
+            lambda f: self.after(0, self._show_results, f)
+        )
+
+    def _show_results(self, future):
+        try:
+            results = future.result()
+        except Exception as exc:
+            messagebox.showerror("Search error", str(exc))
+            return
+        self.display_results(results)
+
+    def filter_centers(self, query):
+        if self.data is None or self.data.empty:
+            return pd.DataFrame(columns=REQUIRED_COLUMNS)
+        # No copy: nothing below mutates the frame, and boolean/iloc
+        # selections already allocate just the result subset.
+        df = self.data
+        q = query.strip().upper()
+
+        # Exact province code or full name is a dict hit.
+        idx = self._exact_prov.get(q)
+        if idx is not None:
+            return self._top_k(np.asarray(idx, dtype=np.int64))
+
+        # Fuzzy match against "City|Province_Full" haystacks: RapidFuzz's
+        # SIMD scorer with a length prune beats repeated substring scans
+        # and also tolerates typos, ranking hits by similarity.
+        # default_process lowercases both sides — RapidFuzz >=2 applies
+        # no processor on its own, and this search is case-insensitive
+        # everywhere else.
+        if process is not None:
+            hits = process.extract(
+                query,
+                self._choices,
+                scorer=fuzz.WRatio,
+                processor=fuzz_utils.default_process,
+                score_cutoff=70,
+                limit=50,
+            )
+            return self._top_k(
+                np.asarray([i for _, _, i in hits], dtype=np.int64)
+            )
+
+        # Without rapidfuzz, fall back to the bigram-indexed substring
+        # ladder below.
+        # One escaped pattern compiled once and reused by every fallback
+        # pass below — no per-pass recompile, and user-typed regex
+        # metacharacters are inert. Each pass still short-circuits the
+        # next one on a hit.
+        pat = re.compile(re.escape(q))
+
+        # Substring fallbacks: intersect the bigram posting lists to get
+        # candidate rows, then verify with str.contains on just those.
+        if len(q) >= 2:
+            postings = [
+                self._bigram_index.get(q[i : i + 2], set())
+                for i in range(len(q) - 1)
+            ]
+            cands = set.intersection(*postings) if postings else set()
+            if not cands:
+                mask = df["_prov_u"].str.contains(pat, na=False)
+                return self._top_k(np.flatnonzero(mask.to_numpy(dtype=bool)))
+            cand_idx = np.asarray(sorted(cands), dtype=np.int64)
+            sub = df.iloc[cand_idx]
+        else:
+            cand_idx = np.arange(len(df), dtype=np.int64)
+            sub = df
+
+        mask = sub["_city_u"].str.contains(pat, na=False).to_numpy(dtype=bool)
+        if mask.any():
+            return self._top_k(cand_idx[mask])
+
+        mask = sub["_prov_full_u"].str.contains(pat, na=False).to_numpy(dtype=bool)
+        if mask.any():
+            return self._top_k(cand_idx[mask])
+
+        mask = df["_prov_u"].str.contains(pat, na=False)
+        return self._top_k(np.flatnonzero(mask.to_numpy(dtype=bool)))
+
+    def _top_k(self, idx, k=TOP_K):
+        """Return the k nearest rows at positions `idx`, sorted by distance.
+
+        argpartition pulls out the k smallest distances in O(n); only
+        those k rows pay for an actual sort.
+        """
+        if len(idx) > k:
+            idx = idx[np.argpartition(self._dist[idx], k - 1)[:k]]
+        idx = idx[np.argsort(self._dist[idx])]
+        return self.data.iloc[idx]
+
+    def display_results(self, results):
+        # One Tcl call clears everything instead of N delete round-trips.
+        self.tree.delete(*self.tree.get_children())
+        if results.empty:
+            messagebox.showinfo("No results", "No relief centers found.")
+            return
+        # Precompute plain string tuples, then hide the tree while
+        # inserting so Tk doesn't re-lay the widget once per row.
+        rows = list(
+            zip(
+                results["Name"].values,
+                results["Type"].values,
+                results["City"].values,
+                (results["Distance (km)"].astype(str) + " km").values,
+                results["Contact"].values,
+            )
+        )
+        self.tree.configure(show="")
+        try:
+            for values in rows:
+                self.tree.insert("", "end", values=values)
+        finally:
+            self.tree.configure(show="headings")
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Phoenix Relief Finder")
+    root.geometry("950x600")
+    page = ReliefPage(root)
+    page.pack(fill="both", expand=True)
+    root.mainloop()
@@ -0,0 +1,31 @@
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+
+class FireDetectionNN(nn.Module):
+    """Small CNN classifying 128x128 satellite tiles as fire / nofire."""
+
+    def __init__(self):
+        super().__init__()
+        self.conv1 = nn.Conv2d(3, 32, kernel_size=3, padding=1)
+        self.bn1 = nn.BatchNorm2d(32)
+        self.conv2 = nn.Conv2d(32, 64, kernel_size=3, padding=1)
+        self.bn2 = nn.BatchNorm2d(64)
+        self.conv3 = nn.Conv2d(64, 128, kernel_size=3, padding=1)
+        self.bn3 = nn.BatchNorm2d(128)
+        self.pool = nn.MaxPool2d(2, 2)
+        self.fc1 = nn.Linear(128 * 16 * 16, 256)
+        self.fc2 = nn.Linear(256, 2)
+        self.dropout = nn.Dropout(0.3)
+
+    def forward(self, x):
+        # In-place relu saves one activation-sized allocation per block,
+        # and flatten (unlike view) accepts channels_last inputs.
+        x = self.pool(F.relu(self.bn1(self.conv1(x)), inplace=True))
+        x = self.pool(F.relu(self.bn2(self.conv2(x)), inplace=True))
+        x = self.pool(F.relu(self.bn3(self.conv3(x)), inplace=True))
+        x = torch.flatten(x, 1)
+        x = F.relu(self.fc1(x), inplace=True)
+        x = self.dropout(x)
+        return self.fc2(x)
@@ -0,0 +1,77 @@
+import os
+
+import torch
+import torch.nn as nn
+from PIL import Image
+from torchvision import models, transforms
+
+try:
+    import batched
+except ImportError:
+    batched = None
+
+device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+WEIGHTS_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "FireDetectionNN.pth"
+)
+
+model = models.resnet50(weights=None)
+model.fc = nn.Linear(model.fc.in_features, 2)
+
+if not os.path.exists(WEIGHTS_PATH):
+    # One-time bootstrap only: start from ImageNet ResNet50, freeze the
+    # backbone, swap the head for our two classes (fire / nofire) and
+    # write the checkpoint. Previously this ran unconditionally on every
+    # import, re-downloading ~100MB of ImageNet weights and clobbering
+    # any fine-tuned FireDetectionNN.pth.
+    bootstrap = models.resnet50(weights=models.ResNet50_Weights.DEFAULT)
+    for param in bootstrap.parameters():
+        param.requires_grad = False
+    bootstrap.fc = nn.Linear(bootstrap.fc.in_features, 2)
+    torch.save(bootstrap.state_dict(), WEIGHTS_PATH)
+
+model.load_state_dict(
+    torch.load(WEIGHTS_PATH, map_location=device, weights_only=True)
+)
+model.to(device)
+model.eval()
+
+_USE_HALF = device.type == "cuda"
+if _USE_HALF:
+    # channels_last + FP16 hits the fast cuDNN NHWC kernels on GPU.
+    model = model.to(memory_format=torch.channels_last).half()
+
+preprocess = transforms.Compose(
+    [
+        transforms.Resize((224, 224)),
+        transforms.ToTensor(),
+        transforms.Normalize(
+            mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]
+        ),
+    ]
+)
+
+
+def _predict_batch(image_paths):
+    imgs = [preprocess(Image.open(p).convert("RGB")) for p in image_paths]
+    batch = torch.stack(imgs).to(device)
+    if _USE_HALF:
+        batch = batch.to(
+            memory_format=torch.channels_last, dtype=torch.float16
+        )
+    with torch.inference_mode():
+        out = model(batch)
+    return out.argmax(1).tolist()
+
+
+if batched is not None:
+    # Concurrent callers within the 30ms window share one forward pass;
+    # a lone call still goes through with batch size 1.
+    _predict_batch = batched.dynamically(batch_size=16, timeout_ms=30)(
+        _predict_batch
+    )
+
+
+def predict_fire_risk(image_path):
+    return _predict_batch([image_path])[0]
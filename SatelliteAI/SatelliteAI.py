@@ -0,0 +1,111 @@
+import os
+
+import torch
+import torch.nn as nn
+import torchvision
+from torchvision import models
+from torchvision.io import ImageReadMode
+from torchvision.transforms import v2
+
+device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+WEIGHTS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "FireDetectionNN.pth"
+)
+
+model = models.resnet50(weights=None)
+model.fc = nn.Linear(model.fc.in_features, 2)
+model.load_state_dict(
+    torch.load(WEIGHTS_PATH, map_location=device, weights_only=True)
+)
+model.to(device)
+model.eval()
+
+if device.type == "cuda":
+    # NHWC is the native layout for cuDNN conv kernels; combined with
+    # FP16 autocast in predict it halves bandwidth and engages tensor
+    # cores.
+    model = model.to(memory_format=torch.channels_last)
+
+# Prefer ONNX Runtime when an exported graph is available (see
+# export_onnx.py): ORT folds constants, fuses conv+bn and packs GEMMs
+# for MLAS/oneDNN, dropping the Python op-dispatch overhead entirely —
+# typically 2-4x on CPU. The torch path stays as the fallback.
+ONNX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fire.onnx"
+)
+_ort_session = None
+try:
+    import onnxruntime as ort
+
+    if os.path.exists(ONNX_PATH):
+        _ort_session = ort.InferenceSession(
+            ONNX_PATH,
+            providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+        )
+except Exception:
+    _ort_session = None
+
+# Compile the inference graph once at import: conv-bn-relu fusion and
+# (on CUDA) graph capture remove the per-op Python dispatch that eager
+# mode pays on every single-image call. The dummy forward absorbs the
+# warmup compile here so the first real request sees no stall. With an
+# ORT session active predict_batch never calls the torch model, so the
+# seconds of warmup are skipped entirely.
+if _ort_session is None:
+    try:
+        model = torch.compile(model, mode="reduce-overhead", fullgraph=True)
+        with torch.no_grad():
+            model(torch.zeros(1, 3, 224, 224, device=device))
+    except Exception:
+        pass  # older torch or unsupported backend: stay eager
+
+# Decode with torchvision.io and run resize/normalize as fused v2 ops on
+# the target device: only the small uint8 image tensor crosses PCIe, and
+# the float conversion + normalization happen in one pass instead of the
+# old PIL -> ToTensor -> Normalize triple walk.
+preprocess = v2.Compose(
+    [
+        v2.Resize((224, 224), antialias=True),
+        v2.ToDtype(torch.float32, scale=True),
+        v2.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
+    ]
+)
+
+
+def preprocess_path(image_path):
+    raw = torchvision.io.read_image(image_path, mode=ImageReadMode.RGB)
+    raw = raw.to(device, non_blocking=True)
+    return preprocess(raw)
+
+
+def preprocess_bytes(content):
+    # Decode straight from the upload buffer — no temp file, no re-read.
+    data = torch.frombuffer(bytearray(content), dtype=torch.uint8)
+    raw = torchvision.io.decode_image(data, mode=ImageReadMode.RGB)
+    raw = raw.to(device, non_blocking=True)
+    return preprocess(raw)
+
+
+def predict_batch(tensors):
+    """Run one forward pass over a list of preprocessed image tensors."""
+    batch = torch.stack(tensors)
+    if _ort_session is not None:
+        out = _ort_session.run(
+            None, {"input": batch.to("cpu", dtype=torch.float32).numpy()}
+        )[0]
+        return out.argmax(1).tolist()
+    if device.type == "cuda":
+        batch = batch.to(memory_format=torch.channels_last)
+        with torch.inference_mode(), torch.autocast(
+            "cuda", dtype=torch.float16
+        ):
+            out = model(batch)
+    else:
+        with torch.inference_mode():
+            out = model(batch)
+    return out.argmax(1).tolist()
+
+
+def predict(image_path):
+    return predict_batch([preprocess_path(image_path)])[0]
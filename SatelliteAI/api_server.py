@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+
+from SatelliteAI import predict_batch, preprocess_bytes
+
+# Requests arriving within this window share one GPU forward pass.
+BATCH_WINDOW_S = 0.01
+MAX_BATCH = 16
+
+
+class BatchPredictor:
+    """Coalesces concurrent predictions into a single model call.
+
+    Uploads landing within BATCH_WINDOW_S are stacked into one
+    (B, 3, 224, 224) batch: same FLOPs per image, but one kernel launch
+    and much better SM occupancy than back-to-back batch-1 calls. A lone
+    request just pays the window (<=10ms) and runs alone.
+    """
+
+    def __init__(self):
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._worker())
+
+    async def submit(self, tensor):
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((tensor, fut))
+        return await fut
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            deadline = loop.time() + BATCH_WINDOW_S
+            while len(items) < MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await asyncio.to_thread(
+                    predict_batch, [tensor for tensor, _ in items]
+                )
+            except Exception as exc:
+                for _, fut in items:
+                    if not fut.done():
+                        fut.set_exception(exc)
+                continue
+            for (_, fut), cls in zip(items, results):
+                if not fut.done():
+                    fut.set_result(cls)
+
+
+batch_predictor = BatchPredictor()
+
+app = FastAPI(title="Phoenix SatelliteAI API")
+
+
+@app.on_event("startup")
+async def _start_batcher():
+    batch_predictor.start()
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+RISK_LABELS = {0: "High fire risk", 1: "Low fire risk"}
+
+# LRU of recent results keyed by content hash: frontend retries of the
+# same file cost a ~GB/s hash + dict lookup instead of a forward pass.
+CACHE_MAX = 512
+_pred_cache = OrderedDict()
+
+
+@app.post("/api/upload-image")
+async def upload_image(image: UploadFile = File(...)):
+    content = await image.read()
+    key = hashlib.blake2b(content, digest_size=16).digest()
+    prediction_class = _pred_cache.get(key)
+    if prediction_class is None:
+        tensor = await asyncio.to_thread(preprocess_bytes, content)
+        prediction_class = await batch_predictor.submit(tensor)
+        _pred_cache[key] = prediction_class
+        if len(_pred_cache) > CACHE_MAX:
+            _pred_cache.popitem(last=False)
+    else:
+        _pred_cache.move_to_end(key)
+    return {
+        "class": prediction_class,
+        "risk": RISK_LABELS.get(prediction_class, "Unknown"),
+    }
@@ -0,0 +1,37 @@
+"""One-time export of the fire-detection ResNet50 to ONNX.
+
+Run from this directory:  python export_onnx.py
+The API server picks up fire.onnx automatically on next start.
+"""
+
+import os
+
+import torch
+import torch.nn as nn
+from torchvision import models
+
+WEIGHTS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "FireDetectionNN.pth"
+)
+ONNX_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fire.onnx"
+)
+
+model = models.resnet50(weights=None)
+model.fc = nn.Linear(model.fc.in_features, 2)
+model.load_state_dict(
+    torch.load(WEIGHTS_PATH, map_location="cpu", weights_only=True)
+)
+model.eval()
+
+dummy = torch.randn(1, 3, 224, 224)
+torch.onnx.export(
+    model,
+    dummy,
+    ONNX_PATH,
+    opset_version=17,
+    input_names=["input"],
+    output_names=["output"],
+    dynamic_axes={"input": {0: "N"}, "output": {0: "N"}},
+)
+print(f"Wrote {ONNX_PATH}")